@@ -2,6 +2,9 @@
 ASCII Art for SKY - Synthesis Knowledge  Agent
 """
 
+import functools
+import sys
+
 SKY_FULL_LOGO = """
 ╭───────────────────────────╮
 │                           │
@@ -34,21 +37,27 @@ SKY_MINIMAL_LOGO = """
 └─────────┘
 """
 
+# Interned once at import so every caller shares one canonical string per size
+_LOGOS = (
+    (80, sys.intern(SKY_FULL_LOGO)),
+    (60, sys.intern(SKY_COMPACT_LOGO)),
+    (30, sys.intern(SKY_MINIMAL_LOGO)),
+)
+_FALLBACK = sys.intern("SKY")
+
+
+@functools.lru_cache(maxsize=4)
 def get_responsive_logo(terminal_width: int) -> str:
     """
     Get the appropriate logo size based on terminal width.
-    
+
     Args:
         terminal_width: Current terminal width in characters
-        
+
     Returns:
         ASCII art string or text fallback
     """
-    if terminal_width >= 80:
-        return SKY_FULL_LOGO
-    elif terminal_width >= 60:
-        return SKY_COMPACT_LOGO
-    elif terminal_width >= 30:
-        return SKY_MINIMAL_LOGO
-    else:
-        return "SKY"
\ No newline at end of file
+    for threshold, logo in _LOGOS:
+        if terminal_width >= threshold:
+            return logo
+    return _FALLBACK
\ No newline at end of file
@@ -3,33 +3,84 @@ SKY - Synthesis Knowledge Yield Agent
 Main CLI entry point for materials synthesis discovery
 """
 
+import functools
+import importlib.util
 import os
 import sys
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.markdown import Markdown
-from rich import print as rprint
+from rich.console import Console, Group
+from rich.text import Text
 
-from .ascii_art import SKY_FULL_LOGO, get_responsive_logo
+from src import ASSETS_DIR
+
+from .ascii_art import get_responsive_logo
 
 app = typer.Typer(
     name="sky",
     help="SKY - Synthesis Knowledge Yield Agent for materials synthesis discovery",
-    add_completion=False
+    add_completion=False,
+    pretty_exceptions_enable=False,
+    pretty_exceptions_show_locals=False,
+)
+# highlight/emoji scanning adds ~15 regex passes per print and nothing here
+# relies on them (emoji in output are literal characters, not shortcodes)
+console = Console(highlight=False, emoji=False, soft_wrap=False)
+
+# Markup-parsed once at import; handlers only copy and append the query
+_CIF_PREFIX = Text.from_markup("[bold cyan]🔬 Analyzing structure from CIF file:[/] ")
+_SEARCH_PREFIX = Text.from_markup("[bold cyan]🔍 Searching for materials similar to:[/] ")
+
+# Reuse agents across repeat searches in one process; construction loads
+# embeddings and models and is by far the most expensive step
+_AGENT_CACHE: dict[str, "SKYSynthesisAgent"] = {}
+
+# Dependencies probed by setup(); frozen so repeat calls allocate nothing
+_DEPS = (
+    ("pymatgen", "Materials analysis"),
+    ("openai_agents", "Agent framework"),
+    ("monty", "Data serialization"),
+    ("h5py", "Embedding storage"),
+    ("mace_torch", "Structure embeddings"),
 )
-console = Console()
+
+# Canonical asset paths, built once at import
+_SYNTHESIS_FILE = ASSETS_DIR / "mp_synthesis_recipes.json.gz"
+_EMBEDDING_FILE = ASSETS_DIR / "embedding" / "mp_dataset_composition_magpie.h5"
+
+# Terminal width probed once per process; the banner repeats across chat turns
+_TERM_WIDTH: int | None = None
+
+
+def _term_width() -> int:
+    global _TERM_WIDTH
+    if _TERM_WIDTH is None:
+        try:
+            _TERM_WIDTH = os.get_terminal_size(sys.stdout.fileno()).columns
+        except OSError:
+            _TERM_WIDTH = 80
+    return _TERM_WIDTH
+
+
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    """Stat a file once, returning None if it does not exist."""
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=4)
+def _get_banner(width: int) -> Text:
+    """Fully-styled banner renderable, built once per terminal width."""
+    return Text(get_responsive_logo(width), style="bold cyan")
 
 
 def show_banner():
     """Display SKY banner"""
-    terminal_width = shutil.get_terminal_size().columns
-    logo = get_responsive_logo(terminal_width)
-    console.print(logo, style="bold cyan")
+    console.print(_get_banner(_term_width()))
 
 
 @app.command()
@@ -53,30 +104,47 @@ def search(
     """
     show_banner()
     
-    # Detect if input is a CIF file
-    is_cif = query.endswith('.cif') and Path(query).exists()
-    
+    # Detect if input is a CIF file; plain formulas skip Path construction
+    # and the stat syscall entirely
+    is_cif = False
+    cif_stem = query
+    if query.endswith('.cif'):
+        cif_path = Path(query)
+        if cif_path.exists():
+            is_cif = True
+            cif_stem = cif_path.stem
+
     if is_cif:
-        console.print(f"[bold cyan]🔬 Analyzing structure from CIF file:[/] {query}\n")
+        headline = _CIF_PREFIX.copy()
         search_type = "structure"
-        material_name = Path(query).stem
+        material_name = cif_stem
     else:
-        console.print(f"[bold cyan]🔍 Searching for materials similar to:[/] {query}\n")
+        headline = _SEARCH_PREFIX.copy()
         search_type = "composition"
         material_name = query
-    
+    headline.append(query)
+    headline.append("\n")
+
     try:
+        from rich.markdown import Markdown
+
         from ..core.synthesis_agent import SKYSynthesisAgent
         from ..report.html_generator import HTMLReportGenerator
-        
-        # Initialize agent
-        console.print("[dim]Initializing SKY agent...[/]")
-        session_id = f"sky_search_{Path(query).stem if is_cif else query}"
-        agent = SKYSynthesisAgent(session_id=session_id)
-        
+
+        # One print for the headline and init notice, then a live status
+        # spinner while the agent works
+        console.print(Group(
+            headline,
+            Text("Initializing SKY agent...", style="dim"),
+        ))
+        session_id = f"sky_search_{cif_stem}"
+        agent = _AGENT_CACHE.get(session_id)
+        if agent is None:
+            agent = _AGENT_CACHE[session_id] = SKYSynthesisAgent(session_id=session_id)
+
         # Run discovery
-        console.print(f"[dim]Discovering synthesis methods using {search_type} similarity...[/]")
-        result = agent.discover_synthesis_sync(query)
+        with console.status(f"[dim]Discovering synthesis methods using {search_type} similarity...[/]"):
+            result = agent.discover_synthesis_sync(query)
         
         # Display results
         console.print("\n[bold green]📊 Results:[/]\n")
@@ -125,26 +193,32 @@ def chat():
     console.print("[dim]Type 'quit' or 'exit' to leave[/]\n")
     
     try:
+        from rich.markdown import Markdown
+
         from ..core.synthesis_agent import SKYSynthesisAgent
-        
+
         # Initialize agent with session
         agent = SKYSynthesisAgent(session_id="sky_chat_session")
         console.print("[green]✅ SKY agent ready![/]\n")
-        
+
         while True:
             # Get user input
             query = typer.prompt("\n[bold]You[/]", prompt_suffix=": ")
-            
+
             if query.lower() in ["quit", "exit", "bye"]:
                 console.print("\n[cyan]👋 Goodbye! Thank you for using SKY.[/]")
                 break
-            
-            # Process query
-            console.print("\n[dim]SKY is thinking...[/]")
+
+            # Process query under a live spinner, then render heading and
+            # answer in a single print; the agent runs every turn on its
+            # own persistent event loop
             try:
-                result = agent.discover_synthesis_sync(query)
-                console.print(f"\n[bold cyan]SKY:[/]\n")
-                console.print(Markdown(result))
+                with console.status("SKY is thinking..."):
+                    result = agent.discover_synthesis_sync(query)
+                console.print(Group(
+                    Text.from_markup("\n[bold cyan]SKY:[/]\n"),
+                    Markdown(result),
+                ))
             except Exception as e:
                 console.print(f"[red]Error processing query: {e}[/]")
                 
@@ -160,9 +234,11 @@ def setup():
     """
     Check environment setup and dependencies.
     """
+    from rich.table import Table
+
     show_banner()
-    console.print("[bold]⚙️ SKY Environment Check[/]\n")
-    
+    heading = Text("⚙️ SKY Environment Check\n", style="bold")
+
     # Create status table
     table = Table(title="Configuration Status")
     table.add_column("Component", style="cyan")
@@ -186,57 +262,46 @@ def setup():
     )
     
     # Check dependencies
-    deps = [
-        ("pymatgen", "Materials analysis"),
-        ("openai_agents", "Agent framework"),
-        ("monty", "Data serialization"),
-        ("h5py", "Embedding storage"),
-        ("mace_torch", "Structure embeddings")
-    ]
-    
-    for module_name, description in deps:
-        try:
-            __import__(module_name.replace("-", "_"))
-            table.add_row(module_name, "✅ Installed", description)
-        except ImportError:
-            table.add_row(module_name, "❌ Missing", description)
+    # find_spec resolves each module without executing it, avoiding
+    # multi-second torch/pymatgen imports just to report "Installed";
+    # the sys.path walks are filesystem-bound, so overlap them
+    with ThreadPoolExecutor(max_workers=len(_DEPS)) as ex:
+        installed = list(ex.map(
+            lambda d: importlib.util.find_spec(d[0].replace("-", "_")) is not None,
+            _DEPS,
+        ))
+    for (module_name, description), ok in zip(_DEPS, installed):
+        table.add_row(module_name, "✅ Installed" if ok else "❌ Missing", description)
     
     # Check data files
-    synthesis_file = Path("/home/ryan/kricthack/kricthack/synthesis-agent/assets/mp_synthesis_recipes.json.gz")
-    embedding_file = Path("/home/ryan/kricthack/kricthack/synthesis-agent/assets/embedding/mp_dataset_composition_magpie.h5")
-    
+    synthesis_stat = _stat_or_none(_SYNTHESIS_FILE)
     table.add_row(
         "Synthesis Recipes",
-        "✅ Found" if synthesis_file.exists() else "❌ Missing",
-        f"{synthesis_file.stat().st_size / 1024 / 1024:.1f} MB" if synthesis_file.exists() else "Required for synthesis data"
+        "✅ Found" if synthesis_stat else "❌ Missing",
+        f"{synthesis_stat.st_size / 1048576:.1f} MB" if synthesis_stat else "Required for synthesis data"
     )
-    
+
+    embedding_stat = _stat_or_none(_EMBEDDING_FILE)
     table.add_row(
         "Composition Embeddings",
-        "✅ Found" if embedding_file.exists() else "❌ Missing",
-        f"{embedding_file.stat().st_size / 1024 / 1024:.1f} MB" if embedding_file.exists() else "Required for similarity search"
+        "✅ Found" if embedding_stat else "❌ Missing",
+        f"{embedding_stat.st_size / 1048576:.1f} MB" if embedding_stat else "Required for similarity search"
     )
     
-    console.print(table)
-    
     # Recommendations
-    console.print("\n[bold]📝 Recommendations:[/]")
+    recommendations = Text()
+    recommendations.append("\n📝 Recommendations:\n", style="bold")
     if not openai_key:
-        console.print("  1. Set OPENAI_MDG_API_KEY environment variable")
+        recommendations.append("  1. Set OPENAI_MDG_API_KEY environment variable\n")
     if not mp_key:
-        console.print("  2. Set MP_API_KEY for enhanced materials data")
-    
-    console.print("\n[green]✅ SKY is ready for synthesis discovery![/]")
+        recommendations.append("  2. Set MP_API_KEY for enhanced materials data\n")
+    recommendations.append("\n✅ SKY is ready for synthesis discovery!", style="green")
 
+    # One Rich render pass for heading, table and recommendations
+    console.print(Group(heading, table, recommendations))
 
-@app.command()
-def demo():
-    """
-    Show feature demonstration and examples.
-    """
-    show_banner()
-    
-    demo_text = """
+
+_DEMO_TEXT = """
 # SKY - Synthesis Knowledge Yield Agent
 
 ## 🔬 Core Capabilities:
@@ -282,9 +347,24 @@ SKY: [Analyzes temperature effects on BiFeO3 formation]
 - **AI Analysis**: GPT-powered insights
 
 ## 🚀 Ready to accelerate your materials synthesis research!
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _demo_renderable():
+    """Parse the demo Markdown once per process."""
+    from rich.markdown import Markdown
+
+    return Markdown(_DEMO_TEXT)
+
+
+@app.command()
+def demo():
     """
-    
-    console.print(Markdown(demo_text))
+    Show feature demonstration and examples.
+    """
+    show_banner()
+    console.print(_demo_renderable())
 
 
 @app.command()
@@ -300,6 +380,11 @@ def version():
 
 def main():
     """Main entry point for SKY CLI"""
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     try:
         app()
     except KeyboardInterrupt:
@@ -2,16 +2,23 @@
 SKY Synthesis Agent - Core implementation for materials synthesis discovery
 """
 
+import asyncio
+import atexit
+import functools
+import gzip
+import io
 import json
 import os
 import re
+from collections import defaultdict
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 
-from monty.serialization import loadfn
 from agents import Agent, Runner, SQLiteSession, function_tool
+from mp_api.client import MPRester
 from pymatgen.core import Composition, Structure
 
+from src import ASSETS_DIR
 from src.embedding import InputType
 from src.search_api import SearchAPI
 from src.agent import SynthesisAgent as CoreSynthesisAgent
@@ -19,8 +26,177 @@ from src.schema import Neighbor
 from src.recursive_synthesis import RecursiveSynthesisSearch
 from sky.report.html_generator import HTMLReportGenerator, SynthesisReportData
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DEFAULT_MODEL = "o3"
 
+RECIPES_FILE = str(ASSETS_DIR / "mp_synthesis_recipes.json.gz")
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool payload to pretty-printed JSON.
+
+    orjson is ~10x faster than stdlib json in indent mode and handles
+    numpy scalars natively; stdlib json remains as a fallback.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY, default=str
+        ).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+
+@functools.lru_cache(maxsize=1)
+def _mpr() -> MPRester:
+    """Long-lived MP client; one TLS handshake amortized over all calls."""
+    mpr = MPRester(os.environ["MP_API_KEY"])
+    atexit.register(mpr.session.close)
+    return mpr
+
+
+@functools.lru_cache(maxsize=1)
+def _core_agent() -> CoreSynthesisAgent:
+    """Shared core agent; its constructor loads the embedding datasets."""
+    return CoreSynthesisAgent()
+
+
+def _parse_recipe_stream(stream):
+    """Yield recipe records from a decompressed JSON-array stream.
+
+    Uses ijson when installed so records are tokenized and discarded
+    one at a time (decompression overlaps index construction); falls
+    back to a one-shot parse otherwise.
+    """
+    try:
+        import ijson
+    except ImportError:
+        yield from json.loads(stream.read())
+    else:
+        yield from ijson.items(stream, "item")
+
+
+def _iter_recipes():
+    """
+    Iterate the recipe corpus in one pass.
+
+    Prefers a `.json.zst` sibling (zstd inflates ~10-20x faster than
+    zlib) when both the file and the zstandard module are present;
+    otherwise reads the gzip through a large buffer instead of monty's
+    default small-chunk path.
+    """
+    zst_file = RECIPES_FILE.removesuffix(".gz") + ".zst"
+    if os.path.exists(zst_file):
+        try:
+            import zstandard
+        except ImportError:
+            pass
+        else:
+            with open(zst_file, "rb") as f:
+                with zstandard.ZstdDecompressor().stream_reader(f) as reader:
+                    yield from _parse_recipe_stream(reader)
+            return
+
+    with gzip.open(RECIPES_FILE, "rb") as f:
+        yield from _parse_recipe_stream(io.BufferedReader(f, buffer_size=1 << 18))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_recipe_index() -> dict[str, list]:
+    """
+    Load the synthesis recipe corpus once and index it by reduced formula.
+
+    The gzip decode, JSON parse and per-recipe Composition parsing all
+    happen a single time per process; queries become dict lookups.
+    """
+    index: dict[str, list] = defaultdict(list)
+    for recipe in _iter_recipes():
+        if 'target_formula' not in recipe:
+            continue
+        try:
+            # One Composition parse per recipe, at build time only; the
+            # reduced key also subsumes the old exact-formula branch
+            # (equal full formulas imply equal reduced formulas)
+            key = Composition(recipe['target_formula']).reduced_formula
+        except Exception:
+            continue
+        index[key].append(recipe)
+    # Freeze to a plain dict; lookups use .get and must not grow the index
+    return dict(index)
+
+
+@functools.lru_cache(maxsize=8192)
+def _comp(formula: str) -> Composition:
+    """Parse a formula once per process; query formulas recur heavily."""
+    return Composition(formula)
+
+# Patterns and keyword tables for analyze_synthesis_parameters, compiled
+# once at import; the unions replace ~9 per-call re.compile passes
+_TEMP_RE = re.compile(r'(\d+)\s*(?:°C|K|degrees?\s*C|celsius)', re.IGNORECASE)
+_TIME_RE = re.compile(r'(\d+)\s*(?:hours?|h\b|minutes?|min\b|days?)', re.IGNORECASE)
+
+_SYNTHESIS_METHODS = {
+    "solid_state": ("solid state", "ceramic", "calcination", "sintering"),
+    "sol_gel": ("sol-gel", "sol gel", "gelation", "xerogel"),
+    "hydrothermal": ("hydrothermal", "solvothermal", "autoclave"),
+    "precipitation": ("precipitation", "coprecipitation", "co-precipitation"),
+    "cvd": ("CVD", "chemical vapor", "vapor deposition"),
+    "combustion": ("combustion", "self-propagating", "SHS"),
+    "flux": ("flux", "molten salt", "flux growth"),
+}
+# One alternation over all method keywords (lowered, matched against the
+# lowered text): a single linear scan reports every category present
+_METHOD_RE = re.compile(
+    "|".join(
+        f"(?P<{method}>{'|'.join(re.escape(kw.lower()) for kw in keywords)})"
+        for method, keywords in _SYNTHESIS_METHODS.items()
+    )
+)
+
+_ATM_KEYWORDS = ("air", "argon", "nitrogen", "N2", "Ar", "oxygen", "O2", "vacuum", "inert")
+# Longest keywords first so e.g. "argon" wins over the embedded "ar"
+_ATM_RE = re.compile(
+    "|".join(sorted((re.escape(kw.lower()) for kw in _ATM_KEYWORDS), key=len, reverse=True))
+)
+_ATM_CANON = {kw.lower(): kw for kw in _ATM_KEYWORDS}
+
+# Filename sanitizer for report paths, compiled once at import
+_SAFE_RE = re.compile(r'[^\w\s-]')
+
+# Summary fields surfaced by get_material_properties; also sent to the MP
+# API so responses only carry these columns
+_SUMMARY_FIELDS = (
+    "material_id",
+    "formula_pretty",
+    "band_gap",
+    "density",
+    "formation_energy_per_atom",
+    "energy_above_hull",
+    "volume",
+)
+
+@functools.lru_cache(maxsize=32)
+def _read_structure_cached(file_path: str, mtime: float) -> Structure:
+    return Structure.from_file(file_path)
+
+
+def _read_structure(file_path: str) -> Structure:
+    """Parse a CIF once per (path, mtime); editing the file invalidates."""
+    return _read_structure_cached(file_path, os.path.getmtime(file_path))
+
+
+def _recipes_for(reduced_formulas) -> dict[str, list]:
+    """Batch lookup of recipes for many reduced formulas, skipping misses.
+
+    The dict-backed analogue of a DataFrame .loc gather: the index is
+    hash-based, so each probe is O(1) regardless of corpus size.
+    """
+    index = _load_recipe_index()
+    return {rf: index[rf] for rf in reduced_formulas if rf in index}
+
+
 SYNTHESIS_AGENT_PROMPT = """
 You are SKY (Synthesis Knowledge Yield), an expert materials synthesis specialist focused on helping researchers discover and understand synthesis recipes for materials.
 
@@ -57,11 +233,10 @@ def read_cif_file(file_path: str) -> str:
         JSON string with structure information
     """
     try:
-        from pymatgen.core import Structure
-        
-        # Read CIF file
-        structure = Structure.from_file(file_path)
-        
+        # Read CIF file (cached, so a follow-up similarity search on the
+        # same file skips the pymatgen CIF parse)
+        structure = _read_structure(file_path)
+
         analysis = {
             "file_path": file_path,
             "formula": structure.composition.formula,
@@ -81,13 +256,13 @@ def read_cif_file(file_path: str) -> str:
             "elements": [str(el) for el in structure.composition.elements],
         }
         
-        return json.dumps(analysis, indent=2, default=str)
+        return _dumps(analysis)
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "error": str(e),
             "file_path": file_path
-        }, indent=2)
+        })
 
 
 @function_tool
@@ -110,13 +285,13 @@ def search_similar_materials_advanced(
         JSON string with similar materials and their properties
     """
     try:
-        # Initialize core synthesis agent
-        core_agent = CoreSynthesisAgent()
-        
+        # Reuse the shared core synthesis agent
+        core_agent = _core_agent()
+
         # Determine input type and search
         if cif_file:
             # Structure-based search from CIF file
-            structure = Structure.from_file(cif_file)
+            structure = _read_structure(cif_file)
             neighbors = core_agent.find_similar_materials_by_structure(
                 structure, n_neighbors=top_n
             )
@@ -130,11 +305,13 @@ def search_similar_materials_advanced(
             search_type = "composition"
             search_query = query
         else:
-            return json.dumps({
+            return _dumps({
                 "error": "Either query or cif_file must be provided"
-            }, indent=2)
+            })
         
-        # Convert Neighbor objects to dict
+        # Shape the Neighbor objects into the fixed response payload in a
+        # single pass; distances are coerced to plain floats so both the
+        # orjson and stdlib encoders emit them as numbers
         results = {
             "search_type": search_type,
             "query": search_query,
@@ -144,20 +321,20 @@ def search_similar_materials_advanced(
                     "rank": n.neighbor_index + 1,
                     "material_id": n.material_id,
                     "formula": n.formula,
-                    "distance": n.distance,
+                    "distance": float(n.distance),
                 }
                 for n in neighbors
             ]
         }
-        
-        return json.dumps(results, indent=2, default=str)
+
+        return _dumps(results)
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "error": str(e),
             "query": query,
             "cif_file": cif_file
-        }, indent=2)
+        })
 
 
 @function_tool
@@ -172,41 +349,36 @@ def get_material_properties(material_ids: List[str]) -> str:
         JSON string with material properties
     """
     try:
-        # Import the MP client from hackathon code (we'll adapt it)
-        import sys
-
-        from mp_api.client import MPRester
-        
         mp_key = os.getenv("MP_API_KEY")
         if not mp_key:
-            return json.dumps({
+            return _dumps({
                 "error": "MP_API_KEY not found in environment"
-            }, indent=2)
-        
-        results = []
-        with MPRester(mp_key) as mpr:
-            docs = mpr.materials.summary.search(material_ids=material_ids)
-            
-            for doc in docs:
-                material_dict = {
-                    "material_id": doc.material_id,
-                    "formula_pretty": doc.formula_pretty,
-                    "band_gap": doc.band_gap,
-                    "density": doc.density,
-                    "formation_energy_per_atom": doc.formation_energy_per_atom,
-                    "energy_above_hull": doc.energy_above_hull,
-                    "volume": doc.volume if hasattr(doc, 'volume') else None,
-                    "mp_url": f"https://materialsproject.org/materials/{doc.material_id}"
-                }
-                results.append(material_dict)
+            })
         
-        return json.dumps(results, indent=2, default=str)
+        # One batched MP request for all ids; shape rows in a single pass
+        docs = _mpr().materials.summary.search(
+            material_ids=material_ids, fields=list(_SUMMARY_FIELDS)
+        )
+
+        results = [None] * len(docs)
+        for i, doc in enumerate(docs):
+            material_dict = {f: getattr(doc, f, None) for f in _SUMMARY_FIELDS}
+            material_dict["mp_url"] = (
+                f"https://materialsproject.org/materials/{material_dict['material_id']}"
+            )
+            results[i] = material_dict
+
+        # MP returns docs unordered; restore the caller's request order
+        by_id = {str(r["material_id"]): r for r in results}
+        ordered = [by_id[mid] for mid in material_ids if mid in by_id]
+
+        return _dumps(ordered)
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "error": str(e),
             "material_ids": material_ids
-        }, indent=2)
+        })
 
 
 @function_tool
@@ -222,76 +394,56 @@ def get_synthesis_recipes(target_formula: str, similar_formulas: Optional[List[s
         JSON string with synthesis recipes and methods
     """
     try:
-        # Load synthesis recipes from compressed JSON
-        recipes_file = "/home/ryan/kricthack/kricthack/synthesis-agent/assets/mp_synthesis_recipes.json.gz"
-        
-        if not os.path.exists(recipes_file):
+        try:
+            # Look up the cached reduced-formula index; only the query
+            # formulas are parsed here, never the corpus
+            index = _load_recipe_index()
+        except FileNotFoundError:
             # Try Materials Project API as fallback
             mp_key = os.getenv("MP_API_KEY")
-            if mp_key:
-                from mp_api.client import MPRester
-                with MPRester(mp_key) as mpr:
-                    recipes = mpr.materials.synthesis.search(target_formula=target_formula)
-                    
-                    results = {
-                        "target_formula": target_formula,
-                        "recipes_found": len(recipes),
-                        "recipes": []
-                    }
-                    
-                    for recipe in recipes[:5]:  # Limit to 5 recipes
-                        recipe_dict = {
-                            "doi": recipe.doi if hasattr(recipe, 'doi') else None,
-                            "paragraph_string": recipe.paragraph_string if hasattr(recipe, 'paragraph_string') else None,
-                            "synthesis_type": recipe.synthesis_type if hasattr(recipe, 'synthesis_type') else None,
-                            "reaction_string": recipe.reaction_string if hasattr(recipe, 'reaction_string') else None,
-                            "target": recipe.target_string if hasattr(recipe, 'target_string') else None,
-                        }
-                        results["recipes"].append(recipe_dict)
-                    
-                    return json.dumps(results, indent=2, default=str)
-            else:
-                return json.dumps({
+            if not mp_key:
+                return _dumps({
                     "error": "Synthesis recipes file not found and MP_API_KEY not set"
-                }, indent=2)
-        
-        # Load compressed synthesis data
-        all_recipes = loadfn(recipes_file)
-        
-        # Search for recipes matching target formula
-        target_comp = Composition(target_formula)
-        matched_recipes = []
-        
-        # Check both exact and reduced formula matches
-        for recipe in all_recipes:
-            if 'target_formula' in recipe:
-                try:
-                    recipe_comp = Composition(recipe['target_formula'])
-                    if (recipe_comp.reduced_formula == target_comp.reduced_formula or 
-                        recipe_comp.formula == target_comp.formula):
-                        matched_recipes.append(recipe)
-                except:
-                    continue
-        
-        # Also check similar formulas if provided
+                })
+
+            recipes = _mpr().materials.synthesis.search(target_formula=target_formula)
+
+            results = {
+                "target_formula": target_formula,
+                "recipes_found": len(recipes),
+                "recipes": []
+            }
+
+            for recipe in recipes[:5]:  # Limit to 5 recipes
+                recipe_dict = {
+                    "doi": recipe.doi if hasattr(recipe, 'doi') else None,
+                    "paragraph_string": recipe.paragraph_string if hasattr(recipe, 'paragraph_string') else None,
+                    "synthesis_type": recipe.synthesis_type if hasattr(recipe, 'synthesis_type') else None,
+                    "reaction_string": recipe.reaction_string if hasattr(recipe, 'reaction_string') else None,
+                    "target": recipe.target_string if hasattr(recipe, 'target_string') else None,
+                }
+                results["recipes"].append(recipe_dict)
+
+            return _dumps(results)
+
+        target_comp = _comp(target_formula)
+        matched_recipes = index.get(target_comp.reduced_formula, [])
+
+        # Also check similar formulas if provided: map reduced keys back
+        # to the caller's formulas once, then gather in a single pass
         similar_recipes = []
         if similar_formulas:
+            sim_keys = {}
             for formula in similar_formulas:
                 try:
-                    sim_comp = Composition(formula)
-                    for recipe in all_recipes:
-                        if 'target_formula' in recipe:
-                            try:
-                                recipe_comp = Composition(recipe['target_formula'])
-                                if recipe_comp.reduced_formula == sim_comp.reduced_formula:
-                                    similar_recipes.append({
-                                        "formula": formula,
-                                        "recipe": recipe
-                                    })
-                            except:
-                                continue
-                except:
+                    sim_keys[_comp(formula).reduced_formula] = formula
+                except Exception:
                     continue
+            similar_recipes = [
+                {"formula": sim_keys[key], "recipe": recipe}
+                for key, recipes in _recipes_for(sim_keys).items()
+                for recipe in recipes[:3]
+            ]
         
         results = {
             "target_formula": target_formula,
@@ -300,95 +452,65 @@ def get_synthesis_recipes(target_formula: str, similar_formulas: Optional[List[s
             "similar_materials_recipes": similar_recipes[:3]  # Limit to 3 similar
         }
         
-        return json.dumps(results, indent=2, default=str)
+        return _dumps(results)
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "error": str(e),
             "target_formula": target_formula
-        }, indent=2)
+        })
+
+
+def _scan(text: str) -> dict:
+    """
+    Extract synthesis parameters from one paragraph of text.
+
+    Pure helper with no tool or JSON concerns, so batch callers (e.g.
+    scoring hundreds of recipe paragraphs during a recursive search) can
+    invoke it directly without per-paragraph serialization.
+    """
+    # Lowercase once; every keyword check below reuses this string
+    lo = text.lower()
+
+    # Extract temperatures and times with the precompiled unions
+    temperatures = set(_TEMP_RE.findall(text))
+    times = set(_TIME_RE.findall(text))
+
+    # Identify synthesis method keywords in one scan of the text
+    detected_methods = {m.lastgroup for m in _METHOD_RE.finditer(lo)}
+
+    # Extract atmosphere conditions, likewise in a single pass
+    atmospheres = {_ATM_CANON[m.group(0)] for m in _ATM_RE.finditer(lo)}
+
+    return {
+        "temperatures_C": list(temperatures),
+        "time_durations": list(times),
+        "synthesis_methods": list(detected_methods),
+        "atmosphere": list(atmospheres),
+        "has_heating": bool(temperatures),
+        "text_length": len(text)
+    }
 
 
 @function_tool
 def analyze_synthesis_parameters(synthesis_text: str) -> str:
     """
     Extract and analyze key synthesis parameters from a synthesis description.
-    
+
     Args:
         synthesis_text: Text description of synthesis procedure
-    
+
     Returns:
         JSON string with extracted parameters and analysis
     """
-    import re
-    
     try:
-        # Extract temperatures
-        temp_patterns = [
-            r'(\d+)\s*°C',
-            r'(\d+)\s*K',
-            r'(\d+)\s*degrees?\s*C',
-            r'(\d+)\s*celsius'
-        ]
-        temperatures = []
-        for pattern in temp_patterns:
-            temps = re.findall(pattern, synthesis_text, re.IGNORECASE)
-            temperatures.extend(temps)
-        
-        # Extract times
-        time_patterns = [
-            r'(\d+)\s*hours?',
-            r'(\d+)\s*h\b',
-            r'(\d+)\s*minutes?',
-            r'(\d+)\s*min\b',
-            r'(\d+)\s*days?'
-        ]
-        times = []
-        for pattern in time_patterns:
-            time_vals = re.findall(pattern, synthesis_text, re.IGNORECASE)
-            times.extend(time_vals)
-        
-        # Identify synthesis method keywords
-        methods = {
-            "solid_state": ["solid state", "ceramic", "calcination", "sintering"],
-            "sol_gel": ["sol-gel", "sol gel", "gelation", "xerogel"],
-            "hydrothermal": ["hydrothermal", "solvothermal", "autoclave"],
-            "precipitation": ["precipitation", "coprecipitation", "co-precipitation"],
-            "cvd": ["CVD", "chemical vapor", "vapor deposition"],
-            "combustion": ["combustion", "self-propagating", "SHS"],
-            "flux": ["flux", "molten salt", "flux growth"]
-        }
-        
-        detected_methods = []
-        for method, keywords in methods.items():
-            for keyword in keywords:
-                if keyword.lower() in synthesis_text.lower():
-                    detected_methods.append(method)
-                    break
-        
-        # Extract atmosphere conditions
-        atmospheres = []
-        atm_keywords = ["air", "argon", "nitrogen", "N2", "Ar", "oxygen", "O2", "vacuum", "inert"]
-        for keyword in atm_keywords:
-            if keyword.lower() in synthesis_text.lower():
-                atmospheres.append(keyword)
-        
-        analysis = {
-            "temperatures_C": list(set(temperatures)),
-            "time_durations": list(set(times)),
-            "synthesis_methods": list(set(detected_methods)),
-            "atmosphere": list(set(atmospheres)),
-            "has_heating": bool(temperatures),
-            "text_length": len(synthesis_text)
-        }
-        
-        return json.dumps(analysis, indent=2)
-        
+        return _dumps(_scan(synthesis_text))
+
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "error": str(e),
             "text": synthesis_text[:100] + "..." if len(synthesis_text) > 100 else synthesis_text
-        }, indent=2)
+        })
 
 
 @function_tool
@@ -423,25 +545,25 @@ def generate_synthesis_html_report(
         if output_filename:
             output_path = Path(output_filename)
         else:
-            safe_name = re.sub(r'[^\w\s-]', '', material_formula)
+            safe_name = _SAFE_RE.sub('', material_formula)
             output_path = Path(f"{safe_name}_synthesis_report.html")
         
         # Generate and save the report
         saved_path = generator.save_report(report_data, output_path)
         
-        return json.dumps({
+        return _dumps({
             "status": "success",
             "report_path": str(saved_path.absolute()),
             "material": material_formula,
             "message": f"HTML report generated successfully: {saved_path.name}"
-        }, indent=2)
+        })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "error": str(e),
             "material": material_formula,
             "message": "Failed to generate HTML report"
-        }, indent=2)
+        })
 
 
 @function_tool
@@ -469,7 +591,7 @@ def recursive_synthesis_search(
     try:
         # Initialize recursive search
         recursive_search = RecursiveSynthesisSearch(
-            synthesis_agent=CoreSynthesisAgent(),
+            synthesis_agent=_core_agent(),
             max_depth=max_depth,
             min_confidence=min_confidence,
             verbose=True  # Enable progress printing
@@ -485,14 +607,14 @@ def recursive_synthesis_search(
         if results["status"] == "success":
             results["summary"] = f"Found {results['unique_materials_with_recipes']} materials with recipes through recursive search of {results['visited_materials']} materials"
         
-        return json.dumps(results, indent=2, default=str)
+        return _dumps(results)
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "error": str(e),
             "target_formula": target_formula,
             "message": "Recursive search failed"
-        }, indent=2)
+        })
 
 
 class SKYSynthesisAgent:
@@ -504,7 +626,11 @@ class SKYSynthesisAgent:
     def __init__(self, session_id: str = None, model: str = DEFAULT_MODEL):
         self.model = model
         self.session = SQLiteSession(session_id) if session_id else None
-        
+
+        # Reused by discover_synthesis_sync; Runner.run_sync would spin a
+        # fresh event loop per call
+        self._loop = asyncio.new_event_loop()
+
         # Set OpenAI API key from environment
         openai_key = os.getenv("OPENAI_MDG_API_KEY")
         if openai_key:
@@ -537,8 +663,11 @@ class SKYSynthesisAgent:
         Returns:
             Synthesis recommendations and procedures
         """
-        # Check if query is a CIF file path
-        is_cif = cif_file or (query and query.endswith('.cif') and Path(query).exists())
+        # Check if query is a CIF file path; the cheap suffix check runs
+        # first so non-CIF queries never touch the filesystem
+        is_cif = cif_file or (
+            query and query[-4:].lower() == '.cif' and Path(query).exists()
+        )
         
         if is_cif:
             cif_path = cif_file or query
@@ -593,8 +722,21 @@ class SKYSynthesisAgent:
         using generate_synthesis_html_report with your complete analysis output.
         """
         
-        result = Runner.run_sync(self.agent, input=prompt, session=self.session)
+        result = self._loop.run_until_complete(
+            Runner.run(self.agent, input=prompt, session=self.session)
+        )
         return result.final_output
+
+    def close(self):
+        """Release the agent's event loop."""
+        if not self._loop.is_closed():
+            self._loop.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
     
     async def discover_synthesis(self, query: str) -> str:
         """
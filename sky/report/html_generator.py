@@ -10,6 +10,124 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 
+# Every pattern used below is compiled once at import; the parser and the
+# per-report formatters only ever touch these objects.
+_FORMULA_PATTERNS = tuple(re.compile(p) for p in (
+    r"Formula:\s*([A-Za-z0-9₀-₉()]+)",  # Unicode subscripts
+    r"Formula:\s*([A-Z][a-zA-Z0-9()]+(?:\s*[A-Z][a-zA-Z0-9()]+)*)",
+    r"Target Material Analysis.*?([A-Z][a-z]?\d*[A-Z][a-z]?\d*[A-Z]?[a-z]?\d*)",
+    r"for\s+([A-Z][a-z]?\d*[A-Z][a-z]?\d*[A-Z]?[a-z]?\d*)",
+))
+_STRUCTURE_RE = re.compile(r"Prototype/Structure:\s*([^•\n]+(?:\n[^•\n]+)*)")
+_STABILITY_RE = re.compile(r"Thermodynamic stability:\s*([^•\n]+(?:\n[^•\n]+)*)")
+_DENSITY_RE = re.compile(r"density[^0-9]*([0-9.,–\-\s]+g[^;]*)", re.IGNORECASE)
+_BANDGAP_RE = re.compile(r"(\d+[–\-]?\d*\.?\d*\s*eV[^)]*)")
+# Numbered blocks are found by splitting on the number anchors; one
+# linear pass, unlike the old lazy +? patterns with lookahead terminators
+_METHOD_SPLIT = re.compile(r"(?m)^\s*(\d+)\s+")
+_STEP_SPLIT = re.compile(r"(\d+)\s+(?=\w)")
+_BULLET_RE = re.compile(r"[•·–-]\s*([^\n•·–]+)")
+# A bullet plus its continuation lines (lines not opening a new bullet),
+# collected in one multiline findall instead of a per-line Python loop
+_BULLET_BLOCK_RE = re.compile(r"^\s*[–•·-]\s*(.+(?:\n(?!\s*[–•·-]).+)*)", re.MULTILINE)
+_ALT_METHOD_RE = re.compile(
+    r"(\d+)\s+([\w\s\-–]+)\s*\n\s*Pros:(.*?)\s*Cons:(.*?)(?=\d+\s+\w+|$)", re.DOTALL
+)
+# Sodium / lithium compounds, ternary and simple iron oxides, merged
+# into one alternation so the document is scanned once, not per family
+_RELATED_RE = re.compile(
+    r"(?:Na[A-Za-z]*[0-9]*O[0-9]*"
+    r"|Li[A-Za-z]*[0-9]*O[0-9]*"
+    r"|[A-Z][a-z]?Fe[0-9]*O[0-9]*"
+    r"|Fe[0-9]*O[0-9]*)"
+)
+_CLOSEST_RE = re.compile(r"closest[^:]*include\s*([^.]+)", re.IGNORECASE)
+_CLOSEST_TOKEN_RE = re.compile(r"([A-Z][a-zA-Z0-9₀-₉]*)")
+
+# _formula_to_html
+_PARENS_RE = re.compile(r'\(([^)]+)\)')
+_DIGITS_RE = re.compile(r'(\d+)')
+_CHARGE_RE = re.compile(r'\^([\+\-]?\d*)')
+
+# _format_chemistry / _format_units
+_TEMP_SUB = re.compile(r'(\d+)\s*°C')
+_CHEM_SUB = re.compile(r'\b([A-Z][a-z]?)(\d+)')
+# Literal unit spellings rewritten in one alternation pass; longest
+# spellings first so e.g. eV/atom wins over an embedded match
+_UNIT_TABLE = {
+    'cm-3': 'cm<sup>−3</sup>',
+    'g/cm3': 'g·cm<sup>−3</sup>',
+    'atom-1': 'atom<sup>−1</sup>',
+    'eV/atom': 'eV·atom<sup>−1</sup>',
+    'min-1': 'min<sup>−1</sup>',
+    'h-1': 'h<sup>−1</sup>',
+    'L/min': 'L·min<sup>−1</sup>',
+}
+_UNIT_RE = re.compile(
+    '|'.join(map(re.escape, sorted(_UNIT_TABLE, key=len, reverse=True)))
+)
+
+_SAFE_NAME_RE = re.compile(r'[^\w\s-]')
+
+# {{PLACEHOLDER}} markers in the HTML template, all filled in one pass
+_PLACEHOLDER_RE = re.compile(r'\{\{([A-Z_]+)\}\}')
+
+# Unicode subscript digits -> ASCII, applied in one C-level pass
+_SUBSCRIPT_TABLE = str.maketrans('₀₁₂₃₄₅₆₇₈₉', '0123456789')
+
+# Section markers located in a single linear scan of the agent output;
+# their first-occurrence offsets replace the per-section substring guards.
+# Critical parameters and Safety match case-insensitively, as their
+# original IGNORECASE patterns did; matches fold to the canonical key.
+_MARKER_RE = re.compile("|".join((
+    re.escape("Target Material Analysis"),
+    re.escape("Recommended Procedure"),
+    "(?i:" + re.escape("Critical parameters") + ")",
+    "(?i:" + re.escape("Safety") + ")",
+    re.escape("Alternative"),
+    "🔬",
+    "🧪",
+    "📝",
+)))
+_MARKER_CANON = {
+    "critical parameters": "Critical parameters",
+    "safety": "Safety",
+}
+
+
+def _slice_section(text: str, start_marker: str, end_markers: tuple,
+                   keep_marker: bool = False, after_colon: bool = False,
+                   start: int = -1, ignore_case: bool = False) -> Optional[str]:
+    """
+    Slice the section that starts at ``start_marker`` and ends at the
+    nearest of ``end_markers`` (or the end of ``text``).
+
+    Pure substring searches: unlike the lazy ``(.*?)`` DOTALL patterns
+    this replaces, locating a section is linear in the text and does no
+    backtracking on documents where the section is absent. Callers that
+    already know the marker offset pass it as ``start``; ``ignore_case``
+    folds the marker searches for sections whose original patterns
+    compiled with ``re.IGNORECASE``.
+    """
+    haystack = text.lower() if ignore_case else text
+    if start < 0:
+        start = haystack.find(start_marker.lower() if ignore_case else start_marker)
+    if start < 0:
+        return None
+    if not keep_marker:
+        start += len(start_marker)
+    if after_colon:
+        colon = text.find(':', start)
+        if colon < 0:
+            return None
+        start = colon + 1
+    end = len(text)
+    for marker in end_markers:
+        pos = haystack.find(marker.lower() if ignore_case else marker, start)
+        if 0 <= pos < end:
+            end = pos
+    return text[start:end]
+
 
 @dataclass
 class SynthesisReportData:
@@ -36,6 +154,7 @@ class HTMLReportGenerator:
     def __init__(self, template_path: Optional[Path] = None):
         """Initialize with optional custom template"""
         self.template_path = template_path or Path(__file__).parent / "template.html"
+        self._template_cache: Optional[str] = None
         
     def parse_agent_output(self, raw_output: str) -> SynthesisReportData:
         """Parse raw SKY agent output into structured report data"""
@@ -46,47 +165,52 @@ class HTMLReportGenerator:
         )
         
         # Extract material formula - look for various patterns
-        formula_patterns = [
-            r"Formula:\s*([A-Za-z0-9₀-₉()]+)",  # Unicode subscripts
-            r"Formula:\s*([A-Z][a-zA-Z0-9()]+(?:\s*[A-Z][a-zA-Z0-9()]+)*)",
-            r"Target Material Analysis.*?([A-Z][a-z]?\d*[A-Z][a-z]?\d*[A-Z]?[a-z]?\d*)",
-            r"for\s+([A-Z][a-z]?\d*[A-Z][a-z]?\d*[A-Z]?[a-z]?\d*)",
-        ]
-        
-        for pattern in formula_patterns:
-            formula_match = re.search(pattern, raw_output)
+        for pattern in _FORMULA_PATTERNS:
+            formula_match = pattern.search(raw_output)
             if formula_match:
-                formula = formula_match.group(1).strip()
                 # Convert unicode subscripts to normal numbers
-                formula = formula.replace('₀', '0').replace('₁', '1').replace('₂', '2')
-                formula = formula.replace('₃', '3').replace('₄', '4').replace('₅', '5')
-                formula = formula.replace('₆', '6').replace('₇', '7').replace('₈', '8').replace('₉', '9')
+                formula = formula_match.group(1).strip().translate(_SUBSCRIPT_TABLE)
                 data.material_formula = formula
                 data.material_formula_html = self._formula_to_html(formula)
                 break
         
+        # Locate every section marker once; the guards and slices below
+        # work from these first-occurrence offsets
+        offsets: Dict[str, int] = {}
+        for marker_match in _MARKER_RE.finditer(raw_output):
+            marker = marker_match.group(0)
+            marker = _MARKER_CANON.get(marker.lower(), marker)
+            offsets.setdefault(marker, marker_match.start())
+
+        # Fast path: short or error output with no section markers at all
+        # skips every section and mention scan below
+        if not offsets:
+            return data
+
         # Extract key properties from bullet points in analysis section
-        analysis_section = re.search(r"Target Material Analysis(.*?)(?:🔬|Synthesis|$)", raw_output, re.DOTALL)
-        if analysis_section:
-            analysis_text = analysis_section.group(1)
-            
+        analysis_text = _slice_section(
+            raw_output, "Target Material Analysis", ("🔬", "Synthesis"),
+            start=offsets.get("Target Material Analysis", -1),
+        )
+        if analysis_text:
+
             # Extract structure/prototype info
-            structure_match = re.search(r"Prototype/Structure:\s*([^•\n]+(?:\n[^•\n]+)*)", analysis_text)
+            structure_match = _STRUCTURE_RE.search(analysis_text)
             if structure_match:
                 data.analysis["structure"] = structure_match.group(1).strip()
             
             # Extract thermodynamic stability
-            stability_match = re.search(r"Thermodynamic stability:\s*([^•\n]+(?:\n[^•\n]+)*)", analysis_text)
+            stability_match = _STABILITY_RE.search(analysis_text)
             if stability_match:
                 data.analysis["thermodynamic_stability"] = stability_match.group(1).strip()
             
             # Look for density mentions
-            density_match = re.search(r"density[^0-9]*([0-9.,–\-\s]+g[^;]*)", analysis_text, re.IGNORECASE)
+            density_match = _DENSITY_RE.search(analysis_text)
             if density_match:
                 data.analysis["density"] = density_match.group(1).strip()
             
             # Look for band gap
-            bandgap_match = re.search(r"(\d+[–\-]?\d*\.?\d*\s*eV[^)]*)", analysis_text)
+            bandgap_match = _BANDGAP_RE.search(analysis_text)
             if bandgap_match:
                 data.analysis["band_gap"] = bandgap_match.group(1).strip()
         
@@ -94,78 +218,81 @@ class HTMLReportGenerator:
         methods = []
         
         # Look for synthesis methods section - broader search
-        method_section = re.search(r"(🔬.*?)(?:🧪|📝|Critical|Safety|Alternative|$)", raw_output, re.DOTALL)
-        if method_section:
-            method_text = method_section.group(1)
-            
-            # Find numbered methods - use the pattern that worked in debug
-            pattern = r"(\d+)\s+([^:\n]+):\s*\n((?:[^0-9][^\n]*\n?)+?)(?=\d+\s+\w+|🧪|📝|$)"
-            method_blocks = re.findall(pattern, method_text, re.MULTILINE | re.DOTALL)
-            
-            for num, name, content in method_blocks:
-                method = {
-                    "name": name.strip().rstrip(':'),
-                    "details": []
-                }
-                
-                # Extract bullet points - look for lines starting with dash/bullet
-                lines = content.split('\n')
-                current_bullet = ""
-                
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith(('–', '•', '·', '-')) and len(line) > 2:
-                        # Save previous bullet if exists
-                        if current_bullet:
-                            method["details"].append(current_bullet.strip())
-                        # Start new bullet
-                        current_bullet = line[1:].strip()  # Remove bullet marker
-                    elif line and current_bullet:
-                        # Continue previous bullet
-                        current_bullet += " " + line
-                
-                # Add the last bullet
-                if current_bullet:
-                    method["details"].append(current_bullet.strip())
-                
-                if method["details"]:  # Only add if we found details
-                    methods.append(method)
+        method_text = _slice_section(
+            raw_output, "🔬", ("🧪", "📝", "Critical", "Safety", "Alternative"),
+            keep_marker=True, start=offsets.get("🔬", -1),
+        )
+        if method_text:
+            # Split on the numbered anchors; a block is a method when its
+            # first line is a "Name:" heading
+            parts = _METHOD_SPLIT.split(method_text)
+            for num, block in zip(parts[1::2], parts[2::2]):
+                heading, _, content = block.partition('\n')
+                name, colon, trailer = heading.partition(':')
+                if not colon or trailer.strip():
+                    continue
+                # Extract bullet points with their continuation lines
+                details = [
+                    " ".join(segment.strip() for segment in bullet.split('\n'))
+                    for bullet in _BULLET_BLOCK_RE.findall(content)
+                ]
+                if details:  # Only add if we found details
+                    methods.append({"name": name.strip(), "details": details})
         
         data.synthesis_methods = methods
         
         # Extract recommended procedure
-        if "Recommended Procedure" in raw_output:
-            proc_match = re.search(r"Recommended Procedure[^:]*:(.*?)(?:Critical parameters|Safety|Alternative|$)", raw_output, re.DOTALL)
-            if proc_match:
-                proc_text = proc_match.group(1)
-                steps = re.findall(r"(\d+)\s*([^0-9]+?)(?=\d+\s+\w+|$)", proc_text)
+        if "Recommended Procedure" in offsets:
+            proc_text = _slice_section(
+                raw_output, "Recommended Procedure",
+                ("Critical parameters", "Safety", "Alternative"),
+                after_colon=True, start=offsets["Recommended Procedure"],
+            )
+            if proc_text:
+                parts = _STEP_SPLIT.split(proc_text)
                 data.recommended_procedure = {
-                    "steps": [{"number": num, "description": desc.strip()} for num, desc in steps]
+                    "steps": [
+                        {"number": num, "description": desc.strip()}
+                        for num, desc in zip(parts[1::2], parts[2::2])
+                        if desc.strip()
+                    ]
                 }
         
         # Extract critical parameters - improved parsing
-        if "Critical parameters" in raw_output or "critical" in raw_output.lower():
-            crit_match = re.search(r"Critical parameters[^:]*:(.*?)(?:Yield|Safety|📝|Alternative|$)", raw_output, re.DOTALL | re.IGNORECASE)
-            if crit_match:
-                crit_text = crit_match.group(1)
+        if "Critical parameters" in offsets:
+            crit_text = _slice_section(
+                raw_output, "Critical parameters",
+                ("Yield", "Safety", "📝", "Alternative"),
+                after_colon=True, start=offsets["Critical parameters"],
+                ignore_case=True,
+            )
+            if crit_text:
                 # Extract lines starting with bullet or dash
-                bullets = re.findall(r"[•·–-]\s*([^\n•·–]+)", crit_text)
+                bullets = _BULLET_RE.findall(crit_text)
                 data.critical_parameters = [b.strip() for b in bullets if b.strip()]
         
         # Extract safety considerations - improved parsing  
-        if "Safety" in raw_output:
-            safety_match = re.search(r"Safety[^:]*:(.*?)(?:📝|Alternative|Pros|Selection|$)", raw_output, re.DOTALL | re.IGNORECASE)
-            if safety_match:
-                safety_text = safety_match.group(1)
-                bullets = re.findall(r"[•·–-]\s*([^\n•·–]+)", safety_text)
+        # The original guard was case-sensitive even though the section
+        # search itself was not; the slice starts from the first match
+        # of either case, exactly as the IGNORECASE pattern did
+        if "Safety" in offsets and "Safety" in raw_output:
+            safety_text = _slice_section(
+                raw_output, "Safety", ("📝", "Alternative", "Pros", "Selection"),
+                after_colon=True, start=offsets["Safety"],
+                ignore_case=True,
+            )
+            if safety_text:
+                bullets = _BULLET_RE.findall(safety_text)
                 data.safety_considerations = [b.strip() for b in bullets if b.strip()]
         
         # Extract alternative routes
-        if "Alternative" in raw_output:
-            alt_match = re.search(r"Alternative[^:]*:(.*?)(?:Selection|Pros|By adhering|$)", raw_output, re.DOTALL)
-            if alt_match:
-                alt_text = alt_match.group(1)
-                alt_methods = re.findall(r"(\d+)\s+([\w\s\-–]+)\s*\n\s*Pros:(.*?)\s*Cons:(.*?)(?=\d+\s+\w+|$)", alt_text, re.DOTALL)
+        if "Alternative" in offsets:
+            alt_text = _slice_section(
+                raw_output, "Alternative", ("Selection", "Pros", "By adhering"),
+                after_colon=True, start=offsets["Alternative"],
+            )
+            if alt_text:
+                alt_methods = _ALT_METHOD_RE.findall(alt_text)
                 for num, name, pros, cons in alt_methods:
                     data.alternative_routes.append({
                         "name": name.strip(),
@@ -173,118 +300,95 @@ class HTMLReportGenerator:
                         "cons": cons.strip()
                     })
         
-        # Extract related materials - look for specific mentions
-        related = []
-        
-        # Look for explicit material mentions in the analysis
-        material_patterns = [
-            r"(Na[A-Za-z]*[0-9]*O[0-9]*)",  # Sodium compounds
-            r"(Li[A-Za-z]*[0-9]*O[0-9]*)",   # Lithium compounds
-            r"([A-Z][a-z]?Fe[0-9]*O[0-9]*)", # Iron oxides
-            r"(Fe[0-9]*O[0-9]*)",           # Simple iron oxides
-        ]
-        
-        for pattern in material_patterns:
-            matches = re.findall(pattern, raw_output)
-            related.extend(matches)
-        
+        # Extract related materials - look for explicit mentions in the
+        # analysis, all compound families matched in a single pass
+        related = _RELATED_RE.findall(raw_output)
+
         # Look for materials specifically mentioned as "closest" or "similar"
-        closest_match = re.search(r"closest[^:]*include\s*([^.]+)", raw_output, re.IGNORECASE)
+        closest_match = _CLOSEST_RE.search(raw_output)
         if closest_match:
-            closest_materials = re.findall(r"([A-Z][a-zA-Z0-9₀-₉]*)", closest_match.group(1))
-            related.extend(closest_materials)
-        
-        # Clean up and convert unicode subscripts
-        cleaned_related = []
-        for material in set(related):  # Remove duplicates
-            if len(material) > 2:  # Filter out single letters
-                # Convert unicode subscripts
-                clean_mat = material.replace('₀', '0').replace('₁', '1').replace('₂', '2')
-                clean_mat = clean_mat.replace('₃', '3').replace('₄', '4').replace('₅', '5')
-                clean_mat = clean_mat.replace('₆', '6').replace('₇', '7').replace('₈', '8').replace('₉', '9')
-                cleaned_related.append(clean_mat)
+            related.extend(_CLOSEST_TOKEN_RE.findall(closest_match.group(1)))
         
-        data.related_materials = list(set(cleaned_related))[:8]  # Unique, limit to 8
+        # Deduplicate in first-seen order, then convert unicode subscripts;
+        # a second ordered pass catches strings that collide after cleanup
+        unique = dict.fromkeys(m for m in related if len(m) > 2)
+        cleaned_related = [m.translate(_SUBSCRIPT_TABLE) for m in unique]
+        data.related_materials = list(dict.fromkeys(cleaned_related))[:8]  # Unique, limit to 8
         
         return data
     
     def _formula_to_html(self, formula: str) -> str:
         """Convert chemical formula to HTML with subscripts"""
         # Handle parentheses first
-        formula = re.sub(r'\(([^)]+)\)', r'(\1)', formula)
+        formula = _PARENS_RE.sub(r'(\1)', formula)
         # Convert numbers to subscripts
-        formula = re.sub(r'(\d+)', r'<sub>\1</sub>', formula)
+        formula = _DIGITS_RE.sub(r'<sub>\1</sub>', formula)
         # Handle special cases like charges
-        formula = re.sub(r'\^([\+\-]?\d*)', r'<sup>\1</sup>', formula)
+        formula = _CHARGE_RE.sub(r'<sup>\1</sup>', formula)
         return formula
     
     def generate_html(self, data: SynthesisReportData) -> str:
         """Generate HTML report from structured data"""
+        return "".join(self._iter_html(data))
+
+    def _iter_html(self, data: SynthesisReportData):
+        """Yield the report as template segments and filled placeholders.
+
+        save_report streams these pieces straight to the file, so the
+        full report string never has to co-reside with the template.
+        """
+        subs = self._build_substitutions(data)
         template = self._get_template()
-        
-        # Build HTML sections
-        html = template
-        
-        # Replace placeholders
-        html = html.replace("{{MATERIAL_NAME}}", data.material_formula_html or data.material_formula)
-        html = html.replace("{{DATE}}", data.generation_date)
-        html = html.replace("{{FORMULA_HTML}}", data.material_formula_html)
-        
+        last = 0
+        for match in _PLACEHOLDER_RE.finditer(template):
+            yield template[last:match.start()]
+            yield subs.get(match.group(1), match.group(0))
+            last = match.end()
+        yield template[last:]
+
+    def _build_substitutions(self, data: SynthesisReportData) -> Dict[str, str]:
+        """Render every template placeholder value for one report"""
         # Build analysis section
-        analysis_html = ""
+        analysis_parts = []
         if data.analysis.get("crystal_system"):
-            analysis_html += f'<div class="kv"><div class="k">Crystal System</div><div class="v">{data.analysis["crystal_system"]}</div></div>'
+            analysis_parts.append(f'<div class="kv"><div class="k">Crystal System</div><div class="v">{data.analysis["crystal_system"]}</div></div>')
         if data.analysis.get("density"):
-            analysis_html += f'<div class="kv"><div class="k">Density</div><div class="v">{self._format_units(data.analysis["density"])}</div></div>'
+            analysis_parts.append(f'<div class="kv"><div class="k">Density</div><div class="v">{self._format_units(data.analysis["density"])}</div></div>')
         if data.analysis.get("formation_energy"):
-            analysis_html += f'<div class="kv"><div class="k">Formation Energy</div><div class="v">{self._format_units(data.analysis["formation_energy"])}</div></div>'
+            analysis_parts.append(f'<div class="kv"><div class="k">Formation Energy</div><div class="v">{self._format_units(data.analysis["formation_energy"])}</div></div>')
         if data.analysis.get("band_gap"):
-            analysis_html += f'<div class="kv"><div class="k">Band Gap</div><div class="v">{data.analysis["band_gap"]}</div></div>'
-        
-        html = html.replace("{{ANALYSIS_PROPERTIES}}", analysis_html)
-        
+            analysis_parts.append(f'<div class="kv"><div class="k">Band Gap</div><div class="v">{data.analysis["band_gap"]}</div></div>')
+
         # Build synthesis methods section
-        methods_html = ""
+        method_parts = []
         for i, method in enumerate(data.synthesis_methods, 1):
-            methods_html += f'<div class="num"><span class="dot">{i}</span>{method["name"]}</div><ul class="list-tight">'
-            for detail in method["details"]:
-                methods_html += f'<li>{self._format_chemistry(detail)}</li>'
-            methods_html += '</ul>'
-        
-        html = html.replace("{{SYNTHESIS_METHODS}}", methods_html or "<p>No direct synthesis methods found. Using analogous routes.</p>")
-        
+            method_parts.append(f'<div class="num"><span class="dot">{i}</span>{method["name"]}</div><ul class="list-tight">')
+            method_parts.extend(f'<li>{self._format_chemistry(detail)}</li>' for detail in method["details"])
+            method_parts.append('</ul>')
+
         # Build recommended procedure
-        procedure_html = ""
-        if data.recommended_procedure.get("steps"):
-            for step in data.recommended_procedure["steps"]:
-                procedure_html += f'''
+        procedure_parts = [
+            f'''
                 <div class="num">
                     <span class="dot">{step["number"]}</span>
                     {self._format_chemistry(step["description"])}
                 </div>'''
-        
-        html = html.replace("{{PROCEDURE_STEPS}}", procedure_html or "<p>See synthesis methods above for recommended procedures.</p>")
-        
+            for step in data.recommended_procedure.get("steps", [])
+        ]
+
         # Build critical parameters
-        params_html = "<ul class='list-tight'>"
-        for param in data.critical_parameters:
-            params_html += f"<li>{self._format_chemistry(param)}</li>"
-        params_html += "</ul>"
-        
-        html = html.replace("{{CRITICAL_PARAMS}}", params_html if data.critical_parameters else "<p>Standard solid-state synthesis parameters apply.</p>")
-        
+        params_html = "<ul class='list-tight'>{}</ul>".format(
+            "".join(f"<li>{self._format_chemistry(param)}</li>" for param in data.critical_parameters)
+        )
+
         # Build safety section
-        safety_html = "<ul class='list-tight'>"
-        for item in data.safety_considerations:
-            safety_html += f"<li>{item}</li>"
-        safety_html += "</ul>"
-        
-        html = html.replace("{{SAFETY_ITEMS}}", safety_html if data.safety_considerations else "<p>Standard laboratory safety procedures apply.</p>")
-        
+        safety_html = "<ul class='list-tight'>{}</ul>".format(
+            "".join(f"<li>{item}</li>" for item in data.safety_considerations)
+        )
+
         # Build alternative routes
-        alt_html = ""
-        for i, route in enumerate(data.alternative_routes, 1):
-            alt_html += f'''
+        alt_parts = [
+            f'''
             <div class="card">
                 <h3>{i}. {route["name"]}</h3>
                 <div class="kvs">
@@ -292,55 +396,79 @@ class HTMLReportGenerator:
                     <div class="kv"><div class="k">Cons</div><div class="v">{route["cons"]}</div></div>
                 </div>
             </div>'''
-        
-        html = html.replace("{{ALTERNATIVE_ROUTES}}", alt_html or "<p>See synthesis methods section for alternative approaches.</p>")
-        
+            for i, route in enumerate(data.alternative_routes, 1)
+        ]
+
         # Build related materials chips
-        chips_html = ""
-        for material in data.related_materials[:8]:
-            chips_html += f'<span class="chip">{self._formula_to_html(material)}</span>'
-        
-        html = html.replace("{{RELATED_MATERIALS}}", chips_html)
-        
+        chips_html = "".join(
+            f'<span class="chip">{self._formula_to_html(material)}</span>'
+            for material in data.related_materials[:8]
+        )
+
         # Add search metadata
         if data.confidence_score > 0:
             confidence_badge = "ok" if data.confidence_score > 0.8 else "warn" if data.confidence_score > 0.5 else "info"
             confidence_html = f'<span class="badge {confidence_badge}">Confidence: {data.confidence_score:.1%}</span>'
         else:
             confidence_html = ""
-        
-        html = html.replace("{{CONFIDENCE_BADGE}}", confidence_html)
-        
-        return html
+
+        return {
+            "MATERIAL_NAME": data.material_formula_html or data.material_formula,
+            "DATE": data.generation_date,
+            "FORMULA_HTML": data.material_formula_html,
+            "ANALYSIS_PROPERTIES": "".join(analysis_parts),
+            "SYNTHESIS_METHODS": "".join(method_parts) or "<p>No direct synthesis methods found. Using analogous routes.</p>",
+            "PROCEDURE_STEPS": "".join(procedure_parts) or "<p>See synthesis methods above for recommended procedures.</p>",
+            "CRITICAL_PARAMS": params_html if data.critical_parameters else "<p>Standard solid-state synthesis parameters apply.</p>",
+            "SAFETY_ITEMS": safety_html if data.safety_considerations else "<p>Standard laboratory safety procedures apply.</p>",
+            "ALTERNATIVE_ROUTES": "".join(alt_parts) or "<p>See synthesis methods section for alternative approaches.</p>",
+            "RELATED_MATERIALS": chips_html,
+            "CONFIDENCE_BADGE": confidence_html,
+        }
     
     def _format_chemistry(self, text: str) -> str:
         """Format chemical text with proper subscripts/superscripts"""
-        # Format temperatures
-        text = re.sub(r'(\d+)\s*°C', r'\1 °C', text)
-        # Format chemical formulas
-        text = re.sub(r'\b([A-Z][a-z]?)(\d+)', r'\1<sub>\2</sub>', text)
-        # Format units
-        text = self._format_units(text)
-        return text
+        # Temperatures, then formula subscripts, then units
+        return self._format_units(
+            _CHEM_SUB.sub(r'\1<sub>\2</sub>', _TEMP_SUB.sub(r'\1 °C', text))
+        )
     
     def _format_units(self, text: str) -> str:
         """Format scientific units with proper HTML"""
-        text = re.sub(r'cm-3', r'cm<sup>−3</sup>', text)
-        text = re.sub(r'g/cm3', r'g·cm<sup>−3</sup>', text)
-        text = re.sub(r'atom-1', r'atom<sup>−1</sup>', text)
-        text = re.sub(r'eV/atom', r'eV·atom<sup>−1</sup>', text)
-        text = re.sub(r'min-1', r'min<sup>−1</sup>', text)
-        text = re.sub(r'h-1', r'h<sup>−1</sup>', text)
-        text = re.sub(r'L/min', r'L·min<sup>−1</sup>', text)
-        return text
+        return _UNIT_RE.sub(lambda m: _UNIT_TABLE[m.group(0)], text)
     
     def _get_template(self) -> str:
-        """Get HTML template"""
-        if self.template_path.exists():
-            return self.template_path.read_text()
-        
-        # Default template
-        return '''<!doctype html>
+        """Get HTML template, reading the file at most once per generator"""
+        if self._template_cache is None:
+            if self.template_path.exists():
+                self._template_cache = self.template_path.read_text()
+            else:
+                self._template_cache = _DEFAULT_TEMPLATE
+        return self._template_cache
+
+    def save_report(self, data: SynthesisReportData, output_path: Path) -> Path:
+        """Generate and save HTML report to file"""
+        output_path = Path(output_path)
+        # Stream template segments and filled sections straight to disk;
+        # the complete report string is never materialized
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 16) as fh:
+            fh.writelines(self._iter_html(data))
+        return output_path
+
+    def from_agent_output(self, raw_output: str, output_path: Optional[Path] = None) -> Path:
+        """Convenience method to generate report directly from agent output"""
+        data = self.parse_agent_output(raw_output)
+
+        if output_path is None:
+            # Default filename based on material formula
+            safe_name = _SAFE_NAME_RE.sub('', data.material_formula)
+            output_path = Path(f"{safe_name}_synthesis_report.html")
+
+        return self.save_report(data, output_path)
+
+
+# Default template used when no template.html sits next to this module
+_DEFAULT_TEMPLATE = '''<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
@@ -463,22 +591,4 @@ class HTMLReportGenerator:
     </div>
   </div>
 </body>
-</html>'''
-    
-    def save_report(self, data: SynthesisReportData, output_path: Path) -> Path:
-        """Generate and save HTML report to file"""
-        html = self.generate_html(data)
-        output_path = Path(output_path)
-        output_path.write_text(html, encoding='utf-8')
-        return output_path
-    
-    def from_agent_output(self, raw_output: str, output_path: Optional[Path] = None) -> Path:
-        """Convenience method to generate report directly from agent output"""
-        data = self.parse_agent_output(raw_output)
-        
-        if output_path is None:
-            # Default filename based on material formula
-            safe_name = re.sub(r'[^\w\s-]', '', data.material_formula)
-            output_path = Path(f"{safe_name}_synthesis_report.html")
-        
-        return self.save_report(data, output_path)
\ No newline at end of file
+</html>'''
\ No newline at end of file
@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from pymatgen.core import Composition, Structure
 from mp_api.client import MPRester
@@ -22,6 +23,10 @@ class SynthesisAgent:
             input_type=InputType.STRUCTURE, max_neighbors=100
         )
         self.mpr = MPRester(api_key=MP_API_KEY)
+        # Recipes keyed by formula; the MP synthesis corpus is static for
+        # the life of the process, so repeat lookups (polymorphs share a
+        # formula) are served locally instead of over HTTP
+        self._recipes_by_formula: dict[str, list[SynthesisRecipe]] = {}
 
     def find_similar_materials_by_composition(
         self, composition_str: str, n_neighbors: int = 10
@@ -32,6 +37,15 @@ class SynthesisAgent:
         )
         return results
 
+    def find_similar_materials_by_compositions(
+        self, composition_strs: list[str], n_neighbors: int = 10
+    ) -> list[list[Neighbor]]:
+        """Batched variant: one featurize and one index search for all."""
+        compositions = [Composition(s) for s in composition_strs]
+        return self.search_api_composition.query_batch(
+            compositions, n_neighbors=n_neighbors
+        )
+
     def find_similar_materials_by_structure(
         self, structure: Structure, n_neighbors: int = 10
     ) -> list[Neighbor]:
@@ -39,13 +53,35 @@ class SynthesisAgent:
         return results
 
     def get_synthesis_recipes_by_formula(self, formula: str) -> list[SynthesisRecipe]:
-        recipes = self.mpr.materials.synthesis.search(target_formula=formula)
+        recipes = self._recipes_by_formula.get(formula)
+        if recipes is None:
+            recipes = self.mpr.materials.synthesis.search(target_formula=formula)
+            self._recipes_by_formula[formula] = recipes
         return recipes
 
+    def get_recipes_for_formulas(
+        self, formulas: list[str]
+    ) -> dict[str, list[SynthesisRecipe]]:
+        """Fetch synthesis recipes for many formulas concurrently.
+
+        The per-formula endpoint only takes one target, so N lookups are
+        N HTTP round trips; running them on a thread pool collapses the
+        serial latency (the client releases the GIL on the socket).
+        """
+        with ThreadPoolExecutor(max_workers=min(16, max(1, len(formulas)))) as executor:
+            recipes = executor.map(self.get_synthesis_recipes_by_formula, formulas)
+            return dict(zip(formulas, recipes))
+
     def get_summarydoc_by_material_id(self, material_id: str) -> list[SummaryDoc]:
         summarydoc = self.mpr.materials.summary.search(material_ids=[material_id])
         return summarydoc
 
+    def get_summarydocs_by_material_ids(
+        self, material_ids: list[str]
+    ) -> list[SummaryDoc]:
+        """Fetch summaries for many ids in one server-side batched request."""
+        return self.mpr.materials.summary.search(material_ids=material_ids)
+
     def get_structure_by_material_id(self, material_id: str) -> Structure:
         structure = self.mpr.materials.get_structure_by_material_id(material_id)
         return structure
@@ -1,9 +1,31 @@
+import functools
 from enum import Enum
 
 import numpy as np
 from pymatgen.core import Structure, Composition
-from matminer.featurizers.composition import ElementProperty
-from mace.calculators import mace_mp
+
+# matminer and mace (which drags in torch and downloads model weights)
+# are imported lazily on first featurization, so composition-only use
+# never pays the structure stack's import cost and vice versa
+
+
+@functools.lru_cache(maxsize=1)
+def _get_magpie():
+    from matminer.featurizers.composition import ElementProperty
+
+    return ElementProperty.from_preset("magpie")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_mace():
+    import torch
+    from mace.calculators import mace_mp
+
+    # Descriptor extraction is compute-bound; build the shared calculator
+    # on the GPU when one is present so weights and CUDA context are paid
+    # for once and reused across all calls
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    return mace_mp(device=device, default_dtype="float32")
 
 
 class InputType(Enum):
@@ -14,26 +36,43 @@ class InputType(Enum):
 class MaterialsEmbedding:
     def __init__(self, input_type: InputType):
         self.input_type = input_type
-        self._magpie_featurizer = None
-        self._mace_calculator = None
 
     def _get_composition_embedding(self, composition: Composition) -> np.ndarray:
-        if self._magpie_featurizer is None:
-            self._magpie_featurizer = ElementProperty.from_preset("magpie")
-
-        return np.array([self._magpie_featurizer.featurize(composition)])
+        return np.asarray(_get_magpie().featurize(composition), dtype=np.float32)
 
     def _get_structure_embedding(self, structure: Structure) -> np.ndarray:
-        if self._mace_calculator is None:
-            self._mace_calculator = mace_mp()
-
-        return np.array(
-            [
-                self._mace_calculator.get_descriptors(structure.to_ase_atoms()).mean(
-                    axis=0
-                )
-            ]
-        )
+        descriptors = _get_mace().get_descriptors(structure.to_ase_atoms())
+        return descriptors.mean(axis=0, dtype=np.float32)
+
+    def get_embeddings(
+        self, input_data: list[Composition] | list[Structure]
+    ) -> np.ndarray:
+        """Featurize many inputs at once, returning an (N, D) array.
+
+        For compositions this goes through matminer's featurize_many,
+        which amortizes per-call overhead and parallelizes across cores
+        instead of paying the scalar featurize path N times.
+        """
+        if self.input_type == InputType.COMPOSITION:
+            features = _get_magpie().featurize_many(
+                input_data, ignore_errors=True, pbar=False
+            )
+            return np.asarray(features, dtype=np.float32)
+        elif self.input_type == InputType.STRUCTURE:
+            import torch
+
+            calculator = _get_mace()
+            # Convert everything up front, then extract all descriptors
+            # with autograd bookkeeping disabled for the whole batch
+            atoms_list = [structure.to_ase_atoms() for structure in input_data]
+            with torch.inference_mode():
+                rows = [
+                    calculator.get_descriptors(atoms).mean(axis=0, dtype=np.float32)
+                    for atoms in atoms_list
+                ]
+            return np.vstack(rows)
+        else:
+            raise ValueError("Invalid input type.")
 
     def get_embedding(self, input_data: Composition | Structure) -> np.ndarray:
         if self.input_type == InputType.COMPOSITION:
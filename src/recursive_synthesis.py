@@ -5,6 +5,9 @@ This module implements a confidence-based recursive search for synthesis recipes
 when direct recipes are not available for a target material.
 """
 
+import functools
+import heapq
+import itertools
 import os
 from typing import List, Dict, Optional, Set, Tuple
 from dataclasses import dataclass, field
@@ -18,6 +21,12 @@ from .schema import Neighbor, SynthesisRecipe
 from .agent import SynthesisAgent
 
 
+@functools.lru_cache(maxsize=4096)
+def _comp(formula: str) -> Composition:
+    """Parse a formula once; adaptation compares the same strings repeatedly."""
+    return Composition(formula)
+
+
 @dataclass
 class RecipeCandidate:
     """Represents a potential synthesis recipe from a neighbor material."""
@@ -96,6 +105,15 @@ class RecursiveSynthesisSearch:
         # Track visited materials to avoid cycles
         self.visited: Set[str] = set()
         self.recipe_candidates: List[RecipeCandidate] = []
+        self._best_confidence_seen = 0.0
+
+        # Memoized neighbor lookups: the tree re-encounters the same
+        # formulas via different parents, and the answers never change.
+        # Recipe lookups are cached on the agent itself.
+        self._neighbor_cache: Dict[Tuple[str, int], List[Neighbor]] = {}
+
+        # Precomputed verbose-log indentation, one entry per depth
+        self._indents = ['  ' * d for d in range(max_depth + 1)]
         
     def search(
         self, 
@@ -114,6 +132,7 @@ class RecursiveSynthesisSearch:
         """
         self.visited.clear()
         self.recipe_candidates.clear()
+        self._best_confidence_seen = 0.0
         
         if self.verbose:
             print(f"🔍 Starting recursive synthesis search for {target_formula}")
@@ -146,82 +165,128 @@ class RecursiveSynthesisSearch:
         confidence_threshold: float
     ):
         """
-        Recursive depth-first search for synthesis recipes.
-        
+        Iterative best-first search for synthesis recipes.
+
+        Nodes sit in a max-heap keyed on confidence, so the most
+        promising branches are expanded (and their recipes collected)
+        first, instead of the old depth-first order that could exhaust a
+        weak branch before ever reaching a strong one. Per-node
+        termination checks are unchanged.
+
         Args:
-            node: Current search node
-            n_neighbors: Number of neighbors to explore
-            confidence_threshold: Current confidence threshold
+            node: Root search node
+            n_neighbors: Number of neighbors to explore from the root
+            confidence_threshold: Initial confidence threshold
         """
-        # Check termination conditions
-        if node.depth >= self.max_depth:
-            if self.verbose:
-                print(f"  {'  ' * node.depth}⛔ Max depth reached at {node.formula}")
-            return
-        
-        if node.confidence < self.min_confidence:
-            if self.verbose:
-                print(f"  {'  ' * node.depth}⛔ Confidence too low ({node.confidence:.3f}) for {node.formula}")
-            return
-        
-        if node.material_id in self.visited and node.material_id != "target":
-            if self.verbose:
-                print(f"  {'  ' * node.depth}🔄 Already visited {node.formula}")
-            return
-        
-        # Mark as visited
-        if node.material_id != "target":
-            self.visited.add(node.material_id)
-        
-        if self.verbose:
-            print(f"  {'  ' * node.depth}📍 Exploring {node.formula} (conf={node.confidence:.3f}, depth={node.depth})")
-        
-        # Try to get recipes for current node
-        if node.material_id != "target":
-            self._check_recipes(node)
-        
-        # Get neighbors
-        try:
-            neighbors = self.agent.find_similar_materials_by_composition(
-                node.formula, 
-                n_neighbors=n_neighbors
-            )
-        except Exception as e:
+        tiebreak = itertools.count()  # keeps heap ordering stable
+        frontier = [(-node.confidence, next(tiebreak), node, n_neighbors, confidence_threshold)]
+
+        while frontier:
+            # Stop once a very_high-confidence recipe plus enough backups
+            # are in hand: the remaining frontier can only add candidates
+            # that _generate_best_guess would discard anyway
+            if self._best_confidence_seen > 0.95 and len(self.recipe_candidates) >= 10:
+                if self.verbose:
+                    print(f"  🏁 Early stop: very high confidence recipe found "
+                          f"({len(self.recipe_candidates)} candidates collected)")
+                return
+
+            _, _, node, n_neighbors, confidence_threshold = heapq.heappop(frontier)
+
+            # Check termination conditions
+            if node.depth >= self.max_depth:
+                if self.verbose:
+                    print(f"  {self._indents[node.depth]}⛔ Max depth reached at {node.formula}")
+                continue
+
+            if node.confidence < self.min_confidence:
+                if self.verbose:
+                    print(f"  {self._indents[node.depth]}⛔ Confidence too low ({node.confidence:.3f}) for {node.formula}")
+                continue
+
+            if node.material_id in self.visited and node.material_id != "target":
+                if self.verbose:
+                    print(f"  {self._indents[node.depth]}🔄 Already visited {node.formula}")
+                continue
+
+            # Mark as visited
+            if node.material_id != "target":
+                self.visited.add(node.material_id)
+
             if self.verbose:
-                print(f"  {'  ' * node.depth}❌ Error getting neighbors: {e}")
-            return
-        
-        # Filter and sort neighbors by confidence
-        filtered_neighbors = [
-            n for n in neighbors 
-            if n.confidence >= confidence_threshold * self.confidence_decay
-            and n.material_id not in self.visited
-        ]
-        
-        # Limit neighbors per level
-        filtered_neighbors = filtered_neighbors[:self.max_neighbors_per_level]
-        
-        if self.verbose and filtered_neighbors:
-            print(f"  {'  ' * node.depth}🔗 Found {len(filtered_neighbors)} promising neighbors")
-        
-        # Recursively explore neighbors
-        for neighbor in filtered_neighbors:
-            child = SearchNode(
-                material_id=neighbor.material_id,
-                formula=neighbor.formula,
-                confidence=neighbor.confidence,
-                distance=neighbor.distance,
-                depth=node.depth + 1,
-                parent=node
-            )
-            node.children.append(child)
-            
-            # Recursive call with decayed threshold
-            self._recursive_search(
-                node=child,
-                n_neighbors=max(5, n_neighbors // 2),  # Reduce neighbors as we go deeper
-                confidence_threshold=confidence_threshold * self.confidence_decay
+                print(f"  {self._indents[node.depth]}📍 Exploring {node.formula} (conf={node.confidence:.3f}, depth={node.depth})")
+
+            # Try to get recipes for current node
+            if node.material_id != "target":
+                self._check_recipes(node)
+
+            # Get neighbors, reusing any earlier answer for this formula
+            cache_key = (node.formula, n_neighbors)
+            neighbors = self._neighbor_cache.get(cache_key)
+            if neighbors is None:
+                try:
+                    neighbors = self.agent.find_similar_materials_by_composition(
+                        node.formula,
+                        n_neighbors=n_neighbors
+                    )
+                except Exception as e:
+                    if self.verbose:
+                        print(f"  {self._indents[node.depth]}❌ Error getting neighbors: {e}")
+                    continue
+                self._neighbor_cache[cache_key] = neighbors
+
+            # Confidence decays monotonically along the distance-sorted
+            # results, so the threshold cut is a prefix boundary found in
+            # O(log n) rather than a per-object Python scan
+            threshold = confidence_threshold * self.confidence_decay
+            confidences = np.fromiter(
+                (n.confidence for n in neighbors), dtype=np.float64, count=len(neighbors)
             )
+            cutoff = int(np.searchsorted(-confidences, -threshold, side="right"))
+
+            # Drop visited and limit neighbors per level
+            visited = self.visited
+            filtered_neighbors = [
+                n for n in neighbors[:cutoff] if n.material_id not in visited
+            ][:self.max_neighbors_per_level]
+
+            if self.verbose and filtered_neighbors:
+                print(f"  {self._indents[node.depth]}🔗 Found {len(filtered_neighbors)} promising neighbors")
+
+            # Prefetch the children's neighborhoods in one batched query
+            # so their expansions hit the cache instead of issuing one
+            # embedding + index search per child
+            child_n_neighbors = max(5, n_neighbors // 2)  # Reduce neighbors as we go deeper
+            to_fetch = list(dict.fromkeys(
+                n.formula for n in filtered_neighbors
+                if (n.formula, child_n_neighbors) not in self._neighbor_cache
+            ))
+            if len(to_fetch) > 1:
+                try:
+                    batches = self.agent.find_similar_materials_by_compositions(
+                        to_fetch, n_neighbors=child_n_neighbors
+                    )
+                    for formula, batch in zip(to_fetch, batches):
+                        self._neighbor_cache[(formula, child_n_neighbors)] = batch
+                except Exception:
+                    pass  # fall back to the per-node queries above
+
+            # Push children onto the frontier with the decayed threshold
+            child_threshold = confidence_threshold * self.confidence_decay
+            for neighbor in filtered_neighbors:
+                child = SearchNode(
+                    material_id=neighbor.material_id,
+                    formula=neighbor.formula,
+                    confidence=neighbor.confidence,
+                    distance=neighbor.distance,
+                    depth=node.depth + 1,
+                    parent=node
+                )
+                node.children.append(child)
+                heapq.heappush(
+                    frontier,
+                    (-child.confidence, next(tiebreak), child, child_n_neighbors, child_threshold),
+                )
     
     def _check_recipes(self, node: SearchNode):
         """
@@ -231,12 +296,13 @@ class RecursiveSynthesisSearch:
             node: Search node to check
         """
         try:
-            # Try to get recipes
+            # Served from the agent's formula-keyed cache after the
+            # first hit, so polymorphic neighbors cost one RTT total
             recipes = self.agent.get_synthesis_recipes_by_formula(node.formula)
-            
+
             if recipes and len(recipes) > 0:
                 if self.verbose:
-                    print(f"  {'  ' * node.depth}✅ Found {len(recipes)} recipe(s) for {node.formula}")
+                    print(f"  {self._indents[node.depth]}✅ Found {len(recipes)} recipe(s) for {node.formula}")
                 
                 # Add each recipe as a candidate
                 for recipe in recipes[:3]:  # Limit to top 3 recipes per material
@@ -250,10 +316,14 @@ class RecursiveSynthesisSearch:
                         reasoning=f"Found via path: {' → '.join(node.get_path())}"
                     )
                     self.recipe_candidates.append(candidate)
-                    
+
+                self._best_confidence_seen = max(
+                    self._best_confidence_seen, node.confidence
+                )
+
         except Exception as e:
             if self.verbose:
-                print(f"  {'  ' * node.depth}⚠️ Could not check recipes for {node.formula}: {e}")
+                print(f"  {self._indents[node.depth]}⚠️ Could not check recipes for {node.formula}: {e}")
     
     def _synthesize_results(self, target_formula: str) -> Dict:
         """
@@ -274,12 +344,20 @@ class RecursiveSynthesisSearch:
                 "recommendations": []
             }
         
-        # Sort candidates by weighted score
-        for candidate in self.recipe_candidates:
-            # Weight by confidence and inverse path length
-            candidate.score = candidate.confidence / (1 + 0.2 * candidate.path_length)
-        
-        self.recipe_candidates.sort(key=lambda x: x.score, reverse=True)
+        # Score all candidates in one vectorized pass (weight confidence
+        # by inverse path length), then reorder by descending score
+        n_candidates = len(self.recipe_candidates)
+        conf = np.fromiter(
+            (c.confidence for c in self.recipe_candidates), np.float64, count=n_candidates
+        )
+        path_lengths = np.fromiter(
+            (c.path_length for c in self.recipe_candidates), np.int32, count=n_candidates
+        )
+        scores = conf / (1 + 0.2 * path_lengths)
+        for candidate, score in zip(self.recipe_candidates, scores.tolist()):
+            candidate.score = score
+        order = np.argsort(-scores, kind="stable")
+        self.recipe_candidates = [self.recipe_candidates[i] for i in order.tolist()]
         
         # Group recipes by material
         recipes_by_material = defaultdict(list)
@@ -327,8 +405,8 @@ class RecursiveSynthesisSearch:
         Returns:
             Adaptation strategy dictionary
         """
-        target_comp = Composition(target)
-        source_comp = Composition(source)
+        target_comp = _comp(target)
+        source_comp = _comp(source)
         
         # Get elemental differences
         target_elements = set(target_comp.elements)
@@ -338,11 +416,17 @@ class RecursiveSynthesisSearch:
         removed_elements = source_elements - target_elements
         common_elements = target_elements & source_elements
         
-        # Calculate stoichiometry changes
+        # Calculate stoichiometry changes; fetch the amount dicts once
+        # instead of re-normalizing over all elements per fraction call
+        target_amounts = target_comp.get_el_amt_dict()
+        source_amounts = source_comp.get_el_amt_dict()
+        target_total = sum(target_amounts.values())
+        source_total = sum(source_amounts.values())
+
         stoich_changes = {}
         for el in common_elements:
-            target_ratio = target_comp.get_atomic_fraction(el)
-            source_ratio = source_comp.get_atomic_fraction(el)
+            target_ratio = target_amounts[str(el)] / target_total
+            source_ratio = source_amounts[str(el)] / source_total
             change = (target_ratio - source_ratio) / source_ratio if source_ratio > 0 else 0
             stoich_changes[str(el)] = {
                 "target": target_ratio,
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 import h5py
 import numpy as np
@@ -15,12 +16,25 @@ comps = [d["structure"].composition for d in mp_data]
 formulas = [d["formula_pretty"] for d in mp_data]
 material_ids = [d["material_id"] for d in mp_data]
 featurizer = ElementProperty.from_preset("magpie")
-features = np.array(featurizer.featurize_many(comps))
+featurizer.set_n_jobs(os.cpu_count())  # featurization is embarrassingly parallel
+# Convert straight to float32: np.array on the list-of-lists would copy
+# everything through float64 first, doubling the transient footprint
+features = np.asarray(
+    featurizer.featurize_many(comps, ignore_errors=True, pbar=False),
+    dtype=np.float32,
+)
 print(f"Shape of features: {features.shape}")
 
 h5_file = dir_assets / "mp_dataset_composition_magpie.h5"
 with h5py.File(h5_file, "w") as f:
-    f.create_dataset("features", data=features, compression="gzip")
+    # float32 + LZF: half the bytes of the default float64/gzip layout
+    # and roughly 3x faster to decompress at SearchAPI startup
+    f.create_dataset(
+        "features",
+        data=features,
+        compression="lzf",
+        chunks=(min(4096, features.shape[0]), features.shape[1]),
+    )
     f.create_dataset("material_ids", data=material_ids, compression="gzip")
     f.create_dataset("formulas", data=formulas, compression="gzip")
 print(f"Saved features and material_ids to {h5_file}")